@@ -5,7 +5,6 @@ LLM Proxy Server Entry Point
 
 import sys
 import logging
-from proxy import Proxy
 
 from oproxy.config import PROXY_CONFIG, get_supported_providers
 
@@ -4,6 +4,8 @@ Supports OpenAI, Claude, and Azure OpenAI endpoints
 """
 
 from typing import Dict, Any, Optional
+from functools import lru_cache
+import logging
 import os
 from oproxy.utils import get_base_url
 
@@ -43,11 +45,26 @@ LLM_PROVIDERS = {
 }
 
 
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def get_log_level(default: str = "INFO") -> str:
+    """Read LOG_LEVEL from the environment, falling back to default if unknown"""
+    level = (os.getenv("LOG_LEVEL") or default).strip().upper()
+    if level not in LOG_LEVELS:
+        logging.getLogger(__name__).warning(
+            f"Unknown LOG_LEVEL {level!r}, expected one of {', '.join(LOG_LEVELS)}; using {default}"
+        )
+        return default
+    return level
+
+
 # Proxy settings
 PROXY_CONFIG = {
     "host": "0.0.0.0",
     "port": 8899,
-    "log_level": "DEBUG" # DEBUG, INFO
+    # DEBUG logs every request's headers and body; enable it for development only
+    "log_level": get_log_level() # DEBUG, INFO, WARNING, ERROR, CRITICAL
 }
 
 
@@ -60,8 +77,13 @@ def get_provider_config(provider: str) -> Dict[str, Any]:
     """Get configuration for a specific provider"""
     return LLM_PROVIDERS.get(provider, {})
 
+@lru_cache(maxsize=64)
 def validate_provider_config(provider: str) -> bool:
-    """Validate that required configuration is present"""
+    """Validate that required configuration is present
+
+    Provider configuration is fixed at import time, so the result is cached
+    to keep this check off the per-request path.
+    """
     config = get_provider_config(provider)
     if not config:
         return False
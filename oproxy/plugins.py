@@ -5,31 +5,68 @@ Routes requests to appropriate LLM providers based on URL patterns
 
 
 import logging
-# from typing import Dict, Any, Optional
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, Optional
-from urllib.parse import urlparse, urljoin, parse_qs
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Union, Optional
+from urllib.parse import urlparse
 
 from proxy.http.parser import HttpParser
 from proxy.http.url import Url
 from proxy.http.server import ReverseProxyBasePlugin
 from proxy.http.exception import HttpRequestRejected
 
-from oproxy.config import get_provider_config, validate_provider_config, get_supported_providers, get_providers
+from oproxy.config import get_provider_config, validate_provider_config, get_providers
 from oproxy.utils import convert_url
 
 
+# URL patterns are fixed by the provider table, build them once
+_ROUTE_PATTERNS: List[Union[str, Tuple[str, List[bytes]]]] = ['/' + key + '/.*' for key in get_providers()]
+
+
+@lru_cache(maxsize=64)
+def _encoded_headers(provider: str) -> Dict[bytes, Tuple[bytes, bytes]]:
+    """Build provider headers in proxy.py's {lower_key: (key, value)} form.
+
+    Header values only depend on the provider configuration, so they are
+    formatted and encoded once per provider rather than on every request.
+    """
+    provider_config = get_provider_config(provider)
+    encoded: Dict[bytes, Tuple[bytes, bytes]] = {}
+
+    base_url = provider_config.get("base_url")
+    if base_url:
+        host = urlparse(base_url).netloc.encode()
+        encoded[b'host'] = (b'Host', host)
+
+    # Add provider-specific headers
+    for key, value in provider_config["headers"].items():
+        header_key = key.encode()
+        header_key_lower = key.lower().encode()
+        header_value = value.format(**provider_config).encode()
+        encoded[header_key_lower] = (header_key, header_value)
+    return encoded
+
+
+@lru_cache(maxsize=64)
+def _encoded_base_url(provider: str) -> bytes:
+    """Upstream base URL prefix (with trailing slash), encoded once per provider"""
+    return get_provider_config(provider).get("base_url", "").encode() + b'/'
+
+
 class LLMProxyPlugin(ReverseProxyBasePlugin):
     """Proxy plugin for routing LLM requests to appropriate providers"""
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.logger = logging.getLogger(__name__)
+        # (provider, path) parsed in before_routing, reused by handle_route
+        self._route: Optional[Tuple[str, bytes]] = None
 
     def before_routing(self, request: HttpParser) -> Optional[HttpParser]:
         """Plugins can modify request, return response, close connection.
         If None is returned, request will be dropped and closed."""
 
-        provider, _ = convert_url(request._url.remainder.decode())  # type: ignore
+        self._route = convert_url(request._url.remainder)  # type: ignore
+        provider, _ = self._route
 
         # Validate provider configuration
         if not validate_provider_config(provider):
@@ -39,20 +76,15 @@ class LLMProxyPlugin(ReverseProxyBasePlugin):
                 reason=f'Provider {provider} not properly configured'.encode()
             )
 
-        # Get provider configuration
-        provider_config = get_provider_config(provider)
-        
         # Update request headers and URL
-        self._update_request_headers(request, provider_config)
+        self._update_request_headers(request, provider)
 
         return request  # pragma: no cover
 
 
     def routes(self) -> List[Union[str, Tuple[str, List[bytes]]]]:
         """Define URL patterns to match for routing"""
-        router_patterns: List[Union[str, Tuple[str, List[bytes]]]] = ['/' + key + '/.*' for key in get_providers()]
-        self.logger.debug(f"Router patterns: {router_patterns}")
-        return router_patterns
+        return _ROUTE_PATTERNS
 
     def handle_route(
         self,
@@ -61,34 +93,21 @@ class LLMProxyPlugin(ReverseProxyBasePlugin):
     ) -> Union[memoryview, Url]:
         """Implement this method if you have configured dynamic routes."""
 
-        self.logger.debug(f"Request: {request.method} {request._url}")
-        self.logger.debug(f"\tHeaders: {request.headers}")
-        self.logger.debug(f"\tBody: {request.body}")
+        # Lazy %-formatting: headers and body can be large and are only
+        # rendered when DEBUG logging is enabled
+        self.logger.debug("Request: %s %s", request.method, request._url)
+        self.logger.debug("\tHeaders: %s", request.headers)
+        self.logger.debug("\tBody: %s", request.body)
 
-        provider, target_url = convert_url(request._url.remainder.decode())  # type: ignore
+        provider, target_url = self._route or convert_url(request._url.remainder)  # type: ignore
 
-        # Get provider configuration
-        provider_config = get_provider_config(provider)
+        target_url = _encoded_base_url(provider) + target_url
 
-        target_url = '/'.join([provider_config.get("base_url", ""), target_url])
+        return  Url.from_bytes(target_url)
 
-        return  Url.from_bytes(target_url.encode())
-
-    def _update_request_headers(self, request: HttpParser, provider_config: Dict[str, Any]):
+    def _update_request_headers(self, request: HttpParser, provider: str):
         """Update request headers with provider-specific authentication"""
-        headers = provider_config["headers"]
-        
         if request.headers is None:
             request.headers = {}
-        
-        base_url = provider_config.get("base_url")
-        if base_url:
-            host = urlparse(base_url).netloc.encode()
-            request.headers[b'host'] = (b'Host', host)
-        
-        # Add provider-specific headers
-        for key, value in headers.items():
-            header_key = key.encode()
-            header_key_lower = key.lower().encode()
-            header_value = value.format(**provider_config).encode()
-            request.headers[header_key_lower] = (header_key, header_value)
+
+        request.headers.update(_encoded_headers(provider))
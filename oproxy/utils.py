@@ -1,8 +1,12 @@
 
-# "/openai/v1/chat/completions" => ('openai', 'v1/chat/completions')
-def convert_url(url: str):
-    result = tuple(url.lstrip("/").split("/", 1))
-    return result 
+from typing import Tuple
+
+
+# b"/openai/v1/chat/completions" => ('openai', b'v1/chat/completions')
+# b"/openai" => ('openai', b'')
+def convert_url(url: bytes) -> Tuple[str, bytes]:
+    provider, _, path = url.lstrip(b"/").partition(b"/")
+    return provider.decode(), path
 
 # https://api.openai.com/v1 -> https://api.openai.com
 # https://api.openai.com/v1/ -> https://api.openai.com
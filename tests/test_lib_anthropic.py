@@ -4,72 +4,88 @@
 """
 
 import os
-from anthropic import Anthropic
+import sys
+import asyncio
+from anthropic import AsyncAnthropic
 
 
 model_name = "claude-3-5-sonnet-20241022"
 
-def test_anthropic_with_base_url(base_url=None, stream=False):
-    """使用自定义 base_url 测试 Anthropic API（用于测试代理）"""
+# 按 base_url 缓存客户端，同一地址的多次测试复用连接池
+_clients = {}
+
+def get_client(base_url=None):
+    """获取（或创建）指定 base_url 的 Anthropic 客户端"""
+    if base_url not in _clients:
+        _clients[base_url] = AsyncAnthropic(api_key=anthropic_api_key, base_url=base_url)
+    return _clients[base_url]
+
+async def check_anthropic_with_base_url(base_url=None, stream=False):
+    """使用自定义 base_url 测试 Anthropic API（用于测试代理），返回测试结果文本"""
     
-    client = Anthropic(api_key=anthropic_api_key, base_url=base_url)
+    lines = []
     
     try:
+        client = get_client(base_url)
+        response = await client.messages.create(
+            model=model_name,
+            max_tokens=50,
+            temperature=0.7,
+            messages=[
+                {"role": "user", "content": "Hello! This is a test through proxy."}
+            ],
+            stream=stream,
+        )
+        
         if stream:
-            response = client.messages.create(
-                model=model_name,
-                max_tokens=50,
-                temperature=0.7,
-                messages=[
-                    {"role": "user", "content": "Hello! This is a test through proxy."}
-                ],
-                stream=True,
-            )
-            
-            print("📡 流式响应:", end=" ")
-            for chunk in response:
+            parts = []
+            async for chunk in response:
                 if chunk.type == "content_block_delta" and chunk.delta.text:
-                    print(chunk.delta.text, end="")
-            print(f"\n✅ 流式响应测试完成 (base_url: {base_url})")
+                    parts.append(chunk.delta.text)
+            lines.append("📡 流式响应: " + "".join(parts))
+            lines.append(f"✅ 流式响应测试完成 (base_url: {base_url})")
         else:
-            response = client.messages.create(
-                model=model_name,
-                max_tokens=50,
-                temperature=0.7,
-                messages=[
-                    {"role": "user", "content": "Hello! This is a test through proxy."}
-                ]
-            )
-            
-            print(f"✅ Anthropic 通过代理调用成功 (base_url: {base_url})")
-            print(f"回复: {response.content[0].text}")
+            lines.append(f"✅ Anthropic 通过代理调用成功 (base_url: {base_url})")
+            lines.append(f"回复: {response.content[0].text}")
         
     except Exception as e:
-        print(f"❌ Anthropic 代理调用失败: {e}")
+        lines.append(f"❌ Anthropic 代理调用失败: {e}")
+
+    return "\n".join(lines)
 
 
 anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
 anthropic_base_url = "http://localhost:8899/anthropic"
 
 
-def main():
+async def amain():
     if not anthropic_api_key:
         print("❌ 错误: 未设置 ANTHROPIC_API_KEY 环境变量")
         return
     
     print("🧪 开始 Anthropic 代理测试...")
     
-    # 测试直接调用（不使用代理）
-    print("\n1. 测试直接调用 Anthropic API:")
-    test_anthropic_with_base_url()
-    
-    # 测试通过代理调用
-    print(f"\n2. 测试通过代理调用（非流式）:")
-    test_anthropic_with_base_url(anthropic_base_url)
-    
-    # 测试通过代理调用（流式）
-    print(f"\n3. 测试通过代理调用（流式）:")
-    test_anthropic_with_base_url(anthropic_base_url, stream=True)
+    # 三个测试互不依赖，并发执行后按顺序输出结果
+    titles = [
+        "1. 测试直接调用 Anthropic API:",       # 不使用代理
+        "2. 测试通过代理调用（非流式）:",
+        "3. 测试通过代理调用（流式）:",
+    ]
+    results = await asyncio.gather(
+        check_anthropic_with_base_url(),
+        check_anthropic_with_base_url(anthropic_base_url),
+        check_anthropic_with_base_url(anthropic_base_url, stream=True),
+    )
+    # 一次性写出全部结果，避免逐行写 stdout
+    sys.stdout.write("".join(f"\n{title}\n{result}\n" for title, result in zip(titles, results)))
+
+    # 关闭缓存的客户端，释放连接池
+    await asyncio.gather(*(client.close() for client in _clients.values()))
+    _clients.clear()
+
+
+def main():
+    asyncio.run(amain())
 
 
 if __name__ == "__main__":
@@ -4,16 +4,28 @@
 """
 
 import os
-from openai import OpenAI
+import sys
+import asyncio
+from openai import AsyncOpenAI
 
 
-def test_openai_with_base_url(base_url=None, stream=False):
-    """使用自定义 base_url 测试 OpenAI API（用于测试代理）"""
+# 按 base_url 缓存客户端，同一地址的多次测试复用 keep-alive 连接
+_clients = {}
+
+def get_client(base_url=None):
+    """获取（或创建）指定 base_url 的 OpenAI 客户端"""
+    if base_url not in _clients:
+        _clients[base_url] = AsyncOpenAI(api_key=openai_api_key, base_url=base_url)
+    return _clients[base_url]
+
+async def check_openai_with_base_url(base_url=None, stream=False):
+    """使用自定义 base_url 测试 OpenAI API（用于测试代理），返回测试结果文本"""
     
-    client = OpenAI(api_key=openai_api_key, base_url=base_url)
+    lines = []
     
     try:
-        response = client.chat.completions.create(
+        client = get_client(base_url)
+        response = await client.chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "user", "content": "Hello! This is a test through proxy."}
@@ -24,27 +36,41 @@ def test_openai_with_base_url(base_url=None, stream=False):
         )
         
         if stream:
-            print("📡 流式响应:", end=" ")
-            for chunk in response:
+            parts = []
+            async for chunk in response:
                 if chunk.choices[0].delta.content is not None:
-                    print(chunk.choices[0].delta.content, end="")
-            print(f"\n✅ 流式响应测试完成 (base_url: {base_url})")
+                    parts.append(chunk.choices[0].delta.content)
+            lines.append("📡 流式响应: " + "".join(parts))
+            lines.append(f"✅ 流式响应测试完成 (base_url: {base_url})")
         else:
-            print(f"✅ OpenAI 通过代理调用成功 (base_url: {base_url})")
-            print(f"回复: {response.choices[0].message.content}")
+            lines.append(f"✅ OpenAI 通过代理调用成功 (base_url: {base_url})")
+            lines.append(f"回复: {response.choices[0].message.content}")
         
     except Exception as e:
-        print(f"❌ OpenAI 代理调用失败: {e}") 
+        lines.append(f"❌ OpenAI 代理调用失败: {e}")
+
+    return "\n".join(lines)
 
 openai_api_key = os.getenv("OPENAI_API_KEY")
 openai_base_url = "http://localhost:8899/openai/v1"
 
+async def amain():
+    # 三个测试互不依赖，并发执行后按顺序输出结果
+    results = await asyncio.gather(
+        check_openai_with_base_url(),
+        check_openai_with_base_url(openai_base_url),
+        check_openai_with_base_url(openai_base_url, stream=True),
+    )
+    # 一次性写出全部结果，避免逐行写 stdout
+    sys.stdout.write("\n".join(results) + "\n")
+
+    # 关闭缓存的客户端，释放连接池
+    await asyncio.gather(*(client.close() for client in _clients.values()))
+    _clients.clear()
+
 def main():
-    
-    test_openai_with_base_url()
-    test_openai_with_base_url(openai_base_url)
-    test_openai_with_base_url(openai_base_url, stream=True)
+    asyncio.run(amain())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()